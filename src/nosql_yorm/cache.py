@@ -1,17 +1,66 @@
 from __future__ import annotations
 
+import copy
+import heapq
+import itertools
 import json
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from nosql_yorm.config import get_config
 from nosql_yorm.utils import CustomEncoder
 
+
+# order_by value that orders by document id alone, like Firestore's FieldPath.document_id()
+DOCUMENT_ID = "__name__"
+
+
+def get_field(data: Dict[str, Any], field_path: str) -> Any:
+    """Look up a dotted field path such as ``"address.city"``; None if any part is missing."""
+    value: Any = data
+    for part in field_path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _sort_key(value: Any) -> tuple:
+    # Missing/None values sort first, the same way Firestore orders nulls
+    return (value is not None, value)
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class NameSpacedCache:
+    """In-memory document store, namespaced like ``namespaces[namespace][collection][id]``.
+
+    Queries are answered from inverted indexes kept in sync by the methods below,
+    so documents go in and come out as copies. ``namespaces`` can be read (e.g. to
+    dump it), but writes made to it directly must be followed by ``reindex()``.
+    """
+
     def __init__(self, output_dir='db_output', filename='cache.json'):
         self.namespaces: Dict[str, Dict[str, Dict[str, Any]]] = {}  # Namespaced collections
         self.output_dir = output_dir
         self.filename = filename
+        # Inverted indexes per (namespace, collection): field -> value -> doc ids.
+        # _indexes covers scalar field values, _array_indexes the elements of list fields.
+        self._indexes: Dict[Tuple[str, str], Dict[str, Dict[Any, Set[str]]]] = {}
+        self._array_indexes: Dict[Tuple[str, str], Dict[str, Dict[Any, Set[str]]]] = {}
+        # Insertion sequence of each doc id, so index hits come back in collection order
+        self._positions: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._sequence = itertools.count()
         # self.load_cache()  # Load existing cache data on initialization
 
     def set_output_dir(self, output_dir: str) -> None:
@@ -31,47 +80,248 @@ class NameSpacedCache:
             if os.path.exists(file_path):
                 with open(file_path, 'r') as f:
                     self.namespaces = json.load(f)
+                self._rebuild_indexes()
     
     def merge_handler(self, handler: 'NameSpacedCache') -> None:
         self.namespaces.update(handler.namespaces)
+        self._rebuild_indexes()
         self.save_cache()
 
+    def reindex(self) -> None:
+        """Rebuild the query indexes after writing to ``namespaces`` directly."""
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        self._indexes.clear()
+        self._array_indexes.clear()
+        self._positions.clear()
+        for namespace, collections in self.namespaces.items():
+            for collection_name, documents in collections.items():
+                for document_id, data in documents.items():
+                    self._index_document(namespace, collection_name, document_id, data)
+
+    def _index_document(self, namespace: str, collection_name: str, document_id: str, data: Dict[str, Any]) -> None:
+        key = (namespace, collection_name)
+        self._positions.setdefault(key, {}).setdefault(document_id, next(self._sequence))
+        indexes = self._indexes.setdefault(key, {})
+        array_indexes = self._array_indexes.setdefault(key, {})
+        for field, value in data.items():
+            if isinstance(value, (list, tuple, set)):
+                for item in value:
+                    if _is_hashable(item):
+                        array_indexes.setdefault(field, {}).setdefault(item, set()).add(document_id)
+            elif _is_hashable(value):
+                indexes.setdefault(field, {}).setdefault(value, set()).add(document_id)
+
+    def _unindex_document(self, namespace: str, collection_name: str, document_id: str, data: Dict[str, Any]) -> None:
+        key = (namespace, collection_name)
+        indexes = self._indexes.get(key, {})
+        array_indexes = self._array_indexes.get(key, {})
+        for field, value in data.items():
+            if isinstance(value, (list, tuple, set)):
+                for item in value:
+                    if _is_hashable(item):
+                        array_indexes.get(field, {}).get(item, set()).discard(document_id)
+            elif _is_hashable(value):
+                indexes.get(field, {}).get(value, set()).discard(document_id)
+
     def add_document(self, collection_name: str, document_id: str, data: Dict[str, Any], namespace: str="default") -> None:
-        self.namespaces.setdefault(namespace, {}).setdefault(collection_name, {})[document_id] = data
+        documents = self.namespaces.setdefault(namespace, {}).setdefault(collection_name, {})
+        if document_id in documents:
+            self._unindex_document(namespace, collection_name, document_id, documents[document_id])
+        # Store a copy so the caller can't change an indexed document behind the indexes' back
+        data = copy.deepcopy(data)
+        documents[document_id] = data
+        self._index_document(namespace, collection_name, document_id, data)
         self.save_cache()
 
     def get_document(self, collection_name: str, document_id: str , namespace: str="default") -> Optional[Dict[str, Any]]:
-        return self.namespaces.get(namespace, {}).get(collection_name, {}).get(document_id)
+        document = self.namespaces.get(namespace, {}).get(collection_name, {}).get(document_id)
+        return copy.deepcopy(document)
+
+    def get_documents_many(self, collection_name: str, document_ids: List[str], namespace: str="default") -> List[Dict[str, Any]]:
+        documents = self.namespaces.get(namespace, {}).get(collection_name, {})
+        return [copy.deepcopy(documents[document_id]) for document_id in document_ids if document_id in documents]
 
     def update_document(self, collection_name: str, document_id: str, data: Dict[str, Any], namespace: str="default") -> None:
         if namespace in self.namespaces and collection_name in self.namespaces[namespace] and document_id in self.namespaces[namespace][collection_name]:
-            self.namespaces[namespace][collection_name][document_id].update(data)
+            document = self.namespaces[namespace][collection_name][document_id]
+            self._unindex_document(namespace, collection_name, document_id, document)
+            document.update(copy.deepcopy(data))
+            self._index_document(namespace, collection_name, document_id, document)
             self.save_cache()
 
     def delete_document(self, collection_name: str, document_id: str, namespace: str="default") -> None:
         if namespace in self.namespaces and collection_name in self.namespaces[namespace] and document_id in self.namespaces[namespace][collection_name]:
-            del self.namespaces[namespace][collection_name][document_id]
+            document = self.namespaces[namespace][collection_name].pop(document_id)
+            self._unindex_document(namespace, collection_name, document_id, document)
+            self._positions[(namespace, collection_name)].pop(document_id, None)
             self.save_cache()
 
     def list_collection(self, collection_name: str, namespace: str="default") -> List[Dict[str, Any]]:
-        return list(self.namespaces.get(namespace, {}).get(collection_name, {}).values())
+        return copy.deepcopy(list(self.namespaces.get(namespace, {}).get(collection_name, {}).values()))
+
+    def query_collection(
+        self,
+        collection_name: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        namespace: str="default",
+        *,
+        array_contains: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        start_after: Any = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict]:
+        matches = self._iter_matching(collection_name, query_params or {}, array_contains or {}, namespace)
+        if order_by is None:
+            # Stop pulling documents as soon as the page is full
+            stop = None if limit is None else offset + limit
+            return [copy.deepcopy(doc) for _, doc in itertools.islice(matches, offset, stop)]
 
-    def query_collection(self, collection_name: str, query_params: Optional[Dict[str, Any]] = None, namespace: str="default") -> List[Dict]:
-        all_docs = self.list_collection(collection_name, namespace)
-        if not query_params:
-            return all_docs
+        if order_by == DOCUMENT_ID:
+            # start_after is the previous page's last document id
+            def sort_key(match: Tuple[str, Dict[str, Any]]) -> Any:
+                return match[0]
 
-        filtered_docs = [doc for doc in all_docs if all(doc.get(key) == value for key, value in query_params.items())]
-        return filtered_docs
+            cursor_key = start_after
+        else:
+            # Ties on the sort field are broken by document id, as in Firestore
+            def sort_key(match: Tuple[str, Dict[str, Any]]) -> Any:
+                document_id, doc = match
+                return _sort_key(get_field(doc, order_by)), document_id
+
+            if start_after is not None:
+                # start_after is the (sort value, document id) pair of the previous page's last document
+                cursor_value, cursor_id = start_after
+                cursor_key = (_sort_key(cursor_value), cursor_id)
+
+        if start_after is not None:
+            if descending:
+                matches = (match for match in matches if sort_key(match) < cursor_key)
+            else:
+                matches = (match for match in matches if sort_key(match) > cursor_key)
+        if limit is None:
+            page = sorted(matches, key=sort_key, reverse=descending)[offset:]
+        else:
+            # Select just the page with a bounded heap instead of sorting the whole collection
+            select = heapq.nlargest if descending else heapq.nsmallest
+            page = select(offset + limit, matches, key=sort_key)[offset:]
+        return [copy.deepcopy(doc) for _, doc in page]
+
+    def query_collection_indexed(
+        self,
+        collection_name: str,
+        equalities: Optional[Dict[str, Any]] = None,
+        array_contains: Optional[Dict[str, Any]] = None,
+        namespace: str="default",
+    ) -> List[Dict]:
+        """Filter a collection by intersecting the inverted indexes.
+
+        Filter values the indexes can't hold (None, which also matches missing
+        fields, and unhashable values) are checked against the documents left
+        after the indexed filters, or a full scan if there are none.
+        """
+        matches = self._iter_matching(collection_name, equalities or {}, array_contains or {}, namespace)
+        return [copy.deepcopy(doc) for _, doc in matches]
+
+    def _iter_matching(
+        self,
+        collection_name: str,
+        equalities: Dict[str, Any],
+        array_contains: Dict[str, Any],
+        namespace: str="default",
+    ) -> Iterable[Tuple[str, Dict]]:
+        documents = self.namespaces.get(namespace, {}).get(collection_name, {})
+        if not equalities and not array_contains:
+            return iter(documents.items())
+
+        # Resolve every filter the indexes can answer by set intersection, and only
+        # check the rest (None, which also matches missing fields, unhashable values,
+        # and tuples, whose fields are indexed by element) against the narrowed candidates
+        indexed_equalities = {
+            key: value
+            for key, value in equalities.items()
+            if value is not None and not isinstance(value, (list, tuple, set)) and _is_hashable(value)
+        }
+        indexed_contains = {key: value for key, value in array_contains.items() if _is_hashable(value)}
+        residual_equalities = {key: value for key, value in equalities.items() if key not in indexed_equalities}
+        residual_contains = {key: value for key, value in array_contains.items() if key not in indexed_contains}
+
+        if indexed_equalities or indexed_contains:
+            key = (namespace, collection_name)
+            indexes = self._indexes.get(key, {})
+            array_indexes = self._array_indexes.get(key, {})
+            matches = [indexes.get(field, {}).get(value, set()) for field, value in indexed_equalities.items()]
+            matches += [array_indexes.get(field, {}).get(value, set()) for field, value in indexed_contains.items()]
+            candidate_ids = reduce(set.intersection, sorted(matches, key=len))
+            positions = self._positions.get(key, {})
+            candidates = ((document_id, documents[document_id]) for document_id in sorted(candidate_ids, key=positions.__getitem__))
+        else:
+            candidates = iter(documents.items())
+
+        if not residual_equalities and not residual_contains:
+            return candidates
+        return (
+            (document_id, doc)
+            for document_id, doc in candidates
+            if all(doc.get(key) == value for key, value in residual_equalities.items())
+            and all(isinstance(doc.get(key), (list, tuple, set)) and value in doc.get(key) for key, value in residual_contains.items())
+        )
 
     def clear_namespace_data(self, namespace: str) -> None:
         if namespace in self.namespaces:
             self.namespaces[namespace].clear()
+            for indexes in (self._indexes, self._array_indexes, self._positions):
+                for key in [key for key in indexes if key[0] == namespace]:
+                    del indexes[key]
             self.save_cache()
 
     def clear_all_data(self) -> None:
         self.namespaces.clear()
+        self._indexes.clear()
+        self._array_indexes.clear()
+        self._positions.clear()
         self.save_cache()
 
+
+class _ExpiringLRU:
+    """A small thread-safe LRU cache whose entries expire after a per-entry ttl."""
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 cache_handler = NameSpacedCache()
 
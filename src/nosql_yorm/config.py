@@ -41,4 +41,21 @@ def initialize_firebase():
             raise ValueError("Firebase credentials path not provided.")
 
         cred = credentials.Certificate(cred_path)
-        firebase_admin.initialize_app(cred)
+        return firebase_admin.initialize_app(cred)
+
+
+def create_firestore_client():
+    """Create a Firestore client using the configured ``firestore_transport`` ("grpc" or "rest")."""
+    app = initialize_firebase()
+    transport = get_config().get("firestore_transport", "grpc")
+    # Client libraries are imported here rather than at module level, so importing
+    # the package (e.g. for the cache alone) doesn't load them
+    if transport == "grpc":
+        from firebase_admin import firestore
+
+        return firestore.client(app)
+    if transport == "rest":
+        from nosql_yorm.firestore_rest import RestFirestoreClient
+
+        return RestFirestoreClient(project=app.project_id, credentials=app.credential.get_credential())
+    raise ValueError(f"Unsupported firestore_transport: {transport!r}")
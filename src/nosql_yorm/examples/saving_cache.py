@@ -28,8 +28,9 @@ same_user = cache_handler.get_document("Users", "1")
 # The class can get any document by id and other methods
 again_the_same_user = User.get_by_id("1")
 
-# the cache is accessible as a dictionary
-your_cached_collections = cache_handler.collections
+# the cache can be read as a dictionary; write through add_document/update_document
+# (or call cache_handler.reindex() afterwards) so its query indexes stay in sync
+your_cached_collections = cache_handler.namespaces
 
 # saving your cached collections to a file
 with open("cached_collections.json", "w") as f:
@@ -0,0 +1,41 @@
+from google.cloud import firestore as google_firestore
+from google.cloud.firestore_v1.services.firestore import client as firestore_gapic_client
+from google.cloud.firestore_v1.services.firestore.transports.rest import FirestoreRestTransport
+from google.oauth2 import credentials as oauth2_credentials
+
+
+class RestFirestoreClient(google_firestore.Client):
+    """Firestore client that calls the API over HTTP/1.1 REST instead of gRPC.
+
+    REST skips the long-lived gRPC channel, which keeps memory low for short-lived,
+    read-mostly processes such as Cloud Functions or Lambda. Long-running servers
+    should stay on gRPC, and realtime listeners (on_snapshot) require it.
+    """
+
+    @property
+    def _firestore_api(self):
+        # Overrides the SDK's private hook that lazily builds the GAPIC client into
+        # _firestore_api_internal, so it may need revisiting on google-cloud-firestore
+        # upgrades. _target already resolves FIRESTORE_EMULATOR_HOST and api_endpoint.
+        if self._firestore_api_internal is None:
+            if self._emulator_host is not None:
+                # Like the gRPC emulator channel: plain HTTP, authorized as "owner"
+                # unless the credentials carry an id token
+                token = getattr(self._credentials, "id_token", None) or "owner"
+                transport = FirestoreRestTransport(
+                    host=self._target,
+                    credentials=oauth2_credentials.Credentials(token),
+                    client_info=self._client_info,
+                    url_scheme="http",
+                )
+            else:
+                transport = FirestoreRestTransport(
+                    host=self._target,
+                    credentials=self._credentials,
+                    client_info=self._client_info,
+                )
+            self._firestore_api_internal = firestore_gapic_client.FirestoreClient(
+                transport=transport,
+                client_options=self._client_options,
+            )
+        return self._firestore_api_internal
@@ -1,43 +1,257 @@
 from __future__ import annotations
-import random
-import string
+import asyncio
+import base64
+import os
+import threading
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, FrozenSet, Generic, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type, TypeVar
 from datetime import datetime
 from firebase_admin import firestore
-from pydantic import BaseModel, Field
-from nosql_yorm.cache import cache_handler
-from nosql_yorm.config import get_config, initialize_firebase
-import re
-import inflect
+from google.api_core import exceptions, retry
+from google.cloud.firestore_v1.field_path import FieldPath
+from pydantic import BaseModel, Field, PrivateAttr
+try:
+    # pydantic v1 internals, only used to decide whether a model can skip validation
+    from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON
+except ImportError:  # pydantic v2
+    SHAPE_DICT = SHAPE_LIST = SHAPE_SINGLETON = None
+from nosql_yorm.cache import DOCUMENT_ID, _ExpiringLRU, cache_handler, get_field
+from nosql_yorm.config import create_firestore_client, get_config, initialize_firebase
+
+# inflect's rule tables are costly to load and most models set __collection_name__,
+# so the engine is only built the first time a name actually needs pluralizing.
+_inflect_engine = None
+
+
+def _plural(name: str) -> str:
+    global _inflect_engine
+    if _inflect_engine is None:
+        import inflect
+
+        _inflect_engine = inflect.engine()
+    return _inflect_engine.plural(name)
+
+
+# Number of document references sent per Firestore getAll call, and how many
+# of those calls may be in flight at once.
+GET_ALL_CHUNK_SIZE = 200
+GET_ALL_MAX_WORKERS = 8
+_get_all_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_all_pool() -> ThreadPoolExecutor:
+    # Created on first use and shared, so get_by_ids doesn't start threads per call
+    global _get_all_executor
+    if _get_all_executor is None:
+        _get_all_executor = ThreadPoolExecutor(max_workers=GET_ALL_MAX_WORKERS, thread_name_prefix="nosql_yorm_get_all")
+    return _get_all_executor
+
+# Firestore caps a WriteBatch at 500 operations; used when BulkWriter is unavailable.
+WRITE_BATCH_SIZE = 500
+WRITE_BATCH_MAX_WORKERS = 4
+# Attempts BulkWriter makes per write before bulk_save reports it failed (BulkWriter's own default)
+BULK_WRITE_MAX_ATTEMPTS = 15
+
+# Retry transient write failures (contention, timeouts) with exponential backoff.
+# Every write retried with it must be idempotent, so new documents get their id
+# client side and are written with set() rather than add()/create().
+WRITE_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(
+        exceptions.Aborted,
+        exceptions.DeadlineExceeded,
+        exceptions.ServiceUnavailable,
+    ),
+    initial=0.1,
+    multiplier=2.0,
+    maximum=2.0,
+    timeout=30.0,
+)
+
+# Opt-in cache of Firestore reads for models that set __cache_ttl__. Page entries
+# are keyed on a per-collection generation that every write bumps, so a write
+# invalidates all cached pages of its collection without scanning the cache.
+# Document entries are only stored if the generation hasn't moved since the read
+# started, checked under the same lock invalidation takes, so a read racing a
+# write can't cache the old document after the write invalidated it.
+READ_CACHE_MAXSIZE = 10_000
+_read_cache = _ExpiringLRU(maxsize=READ_CACHE_MAXSIZE)
+_read_cache_lock = threading.Lock()
+_collection_generations: Dict[str, int] = {}
+
+
+def _invalidate_reads(collection_name: str, doc_ids: Iterable[str] = ()) -> None:
+    with _read_cache_lock:
+        for doc_id in doc_ids:
+            _read_cache.pop((collection_name, doc_id))
+        _collection_generations[collection_name] = _collection_generations.get(collection_name, 0) + 1
+
+
+def _cache_read(collection_name: str, generation: int, key: Any, value: Any, ttl: float) -> None:
+    with _read_cache_lock:
+        if _collection_generations.get(collection_name, 0) == generation:
+            _read_cache.set(key, value, ttl)
+
+
+# Field types that come back from Firestore exactly as validation would leave them,
+# so hydrating them with construct() is safe. Nested models, enums, sets, tuples,
+# unions and the like still need validation to be coerced back from their stored form.
+_PLAIN_FIELD_TYPES = (str, int, float, bool, datetime, list, dict, Any)
+
+
+def _is_plain_field(field: Any) -> bool:
+    if field.class_validators or field.type_ not in _PLAIN_FIELD_TYPES:
+        return False
+    if field.shape == SHAPE_DICT:
+        return field.key_field is not None and field.key_field.type_ is str
+    return field.shape in (SHAPE_SINGLETON, SHAPE_LIST)
 
-# Define the regex pattern for a Firestore ID
-FIRESTORE_ID_PATTERN = re.compile(r"^[a-z0-9]{20}$")
-
-
-p = inflect.engine()
 
 T = TypeVar("T", bound="BaseFirebaseModel")
 db = None
+async_db = None
+
+def set_firestore_client(client=None):
+    """Set the client used for Firestore reads and writes.
 
-def set_firestore_client(client):
+    Without a client, one is created for the configured ``firestore_transport``.
+    """
     global db
     initialize_firebase()
-    db = client
+    db = client if client is not None else create_firestore_client()
+
+
+def set_async_firestore_client(client):
+    """Set the AsyncClient used by the aget_* methods."""
+    global async_db
+    initialize_firebase()
+    async_db = client
+
+
+def _chunks(seq: Sequence[Any], n: int) -> Iterator[Sequence[Any]]:
+    """Yield successive n-sized slices from seq."""
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
 
 
 class BaseFirebaseModel(BaseModel, Generic[T]):
     id: Optional[str] = Field(default_factory=lambda: None)
     __collection_name__: str = ""
+    # Whether to skip validation when hydrating Firestore documents. None trusts
+    # them only if every field has a plain type and no validators; set True or
+    # False to decide explicitly.
+    __trust_db_payload__: Optional[bool] = None
+    # Seconds to keep get_by_id/get_page results from Firestore in the read cache;
+    # None leaves reads uncached. Writes made through this package invalidate it.
+    __cache_ttl__: Optional[float] = None
     _collection_name: str = ""
     created_at: Optional[datetime] = Field(default_factory=lambda: None)
     updated_at: Optional[datetime] = Field(default_factory=lambda: None)
+    # Fields assigned since the instance was loaded or last saved. None means the
+    # instance didn't come from the database, so save() writes every field.
+    _dirty_fields: Optional[Set[str]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if self._dirty_fields is not None and name in self.__fields__:
+            self._dirty_fields.add(name)
+
+    def _changed_fields(self) -> Optional[Set[str]]:
+        if self._dirty_fields is None:
+            return None
+        # Lists, dicts and nested models can be changed in place without going
+        # through __setattr__, so they are always written
+        mutable = {name for name, value in self.__dict__.items() if isinstance(value, (list, dict, set, BaseModel))}
+        return self._dirty_fields | mutable
+
+    def _mark_clean(self) -> None:
+        self._dirty_fields = set()
 
     @classmethod
     def _get_collection_name(cls):
-        value = cls.__collection_name__ or cls._collection_name or p.plural(cls.__name__)
+        # Look in the class's own __dict__ so subclasses don't inherit a parent's cached name
+        cached = cls.__dict__.get("_cached_collection_name")
+        if cached:
+            return cached
+        value = cls.__collection_name__ or cls._collection_name or _plural(cls.__name__)
+        cls._cached_collection_name = value
         return value
 
+    @classmethod
+    def _collection_ref(cls):
+        # Reuse one CollectionReference per class, rebuilt if set_firestore_client swapped the client
+        cached = cls.__dict__.get("_cached_collection_ref")
+        if cached is None or cached[0] is not db:
+            cached = (db, db.collection(cls._get_collection_name()))
+            cls._cached_collection_ref = cached
+        return cached[1]
+
+    @classmethod
+    def _trusts_db_payload(cls) -> bool:
+        # Worked out once per class, in the class's own __dict__ like the collection name
+        trusted = cls.__dict__.get("_cached_trust_db_payload")
+        if trusted is None:
+            trusted = cls.__trust_db_payload__
+            if trusted is None:
+                # Without the v1 field internals (pydantic v2) the check can't be made, so validate
+                trusted = (
+                    SHAPE_SINGLETON is not None
+                    and not cls.__pre_root_validators__
+                    and not cls.__post_root_validators__
+                    and all(_is_plain_field(field) for field in cls.__fields__.values())
+                )
+            cls._cached_trust_db_payload = trusted
+        return trusted
+
+    @classmethod
+    def _construct_fields(cls) -> Tuple[Optional[FrozenSet[str]], FrozenSet[str]]:
+        # The field names construct() may be given (None when the model allows extra
+        # keys) and the required ones, worked out once per class
+        cached = cls.__dict__.get("_cached_construct_fields")
+        if cached is None:
+            model_fields = getattr(cls, "model_fields", None)
+            if model_fields is not None:  # pydantic v2
+                extra = cls.model_config.get("extra")
+                required = frozenset(name for name, field in model_fields.items() if field.is_required())
+            else:
+                model_fields = cls.__fields__
+                extra = cls.__config__.extra
+                required = frozenset(name for name, field in model_fields.items() if field.required)
+            cached = (None if extra == "allow" else frozenset(model_fields), required)
+            cls._cached_construct_fields = cached
+        return cached
+
+    @classmethod
+    def _from_db(cls: Type[T], **data: Any) -> T:
+        # Only for fresh snapshot dicts: construct() keeps the values as-is, so
+        # cached documents still go through cls() (_from_cache) to avoid sharing their lists.
+        instance = None
+        if cls._trusts_db_payload():
+            names, required = cls._construct_fields()
+            # construct() neither drops undeclared keys nor checks required fields, so do
+            # the former here and leave documents missing a required field to validation
+            if required <= data.keys():
+                if names is not None:
+                    data = {key: value for key, value in data.items() if key in names}
+                instance = cls.construct(**data)
+        if instance is None:
+            instance = cls(**data)
+        instance._mark_clean()
+        return instance
+
+    @classmethod
+    def _from_snapshot(cls: Type[T], doc: Any) -> T:
+        # to_dict() returns a fresh dict, so drop a stored "id" in place; the snapshot id is authoritative
+        data = doc.to_dict() or {}
+        data.pop("id", None)
+        return cls._from_db(id=doc.id, **data)
+
+    @classmethod
+    def _from_cache(cls: Type[T], **data: Any) -> T:
+        instance = cls(**data)
+        instance._mark_clean()
+        return instance
+
     @classmethod
     def get_by_id(
         cls: Type[T],
@@ -51,15 +265,24 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
 
         if read_write_to_cache:
             doc_data = cache_handler.get_document(collection_name, doc_id, namespace)
-            return cls(**doc_data) if doc_data else None
+            return cls._from_cache(**doc_data) if doc_data else None
         else:
-            doc_ref = db.collection(collection_name).document(doc_id)
+            cache_key = (collection_name, doc_id)
+            if cls.__cache_ttl__:
+                hit = _read_cache.get(cache_key)
+                if type(hit) is cls:
+                    return hit.copy(deep=True)
+                # Taken before the read, so a write landing during it keeps the result out of the cache
+                generation = _collection_generations.get(collection_name, 0)
+
+            doc_ref = cls._collection_ref().document(doc_id)
             doc = doc_ref.get()
-            data = doc.to_dict()
-            # exclude id from data
-            if data:
-                data.pop("id", None)
-            return cls(id=doc.id, **data) if doc.exists else None
+            if not doc.exists:
+                return None
+            instance = cls._from_snapshot(doc)
+            if cls.__cache_ttl__:
+                _cache_read(collection_name, generation, cache_key, instance.copy(deep=True), cls.__cache_ttl__)
+            return instance
 
     @classmethod
     def get_by_ids(
@@ -75,65 +298,158 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
 
         if read_write_to_cache:
             # Fetch documents from the test cache
-            for doc_id in doc_ids:
-                doc_data = cache_handler.get_document(
-                    collection_name, doc_id, namespace
-                )
-                if doc_data:
-                    documents.append(cls(**doc_data))
+            docs_data = cache_handler.get_documents_many(collection_name, doc_ids, namespace)
+            documents = [cls._from_cache(**doc_data) for doc_data in docs_data if doc_data]
         else:
-            # Fetch documents from Firestore
-            docs_refs = [
-                db.collection(collection_name).document(doc_id) for doc_id in doc_ids
-            ]
-            docs = db.get_all(docs_refs)
-            for doc in docs:
-                data = doc.to_dict()
-                if data:
-                    data.pop("id", None)  # Exclude the ID from the data if it's there
-                    documents.append(cls(id=doc.id, **data))
+            # Fetch documents from Firestore in chunks, running the getAll calls concurrently.
+            # Bind the client and hydrator locally so the loops below skip global/attribute lookups.
+            client = db
+            from_snapshot = cls._from_snapshot
+            collection_ref = cls._collection_ref()
+
+            def fetch_chunk(chunk):
+                return list(client.get_all([collection_ref.document(doc_id) for doc_id in chunk]))
+
+            chunks = list(_chunks(doc_ids, GET_ALL_CHUNK_SIZE))
+            snapshots = {}
+            if len(chunks) <= 1:
+                # A single getAll call gains nothing from a thread
+                chunk_results = [fetch_chunk(chunk) for chunk in chunks]
+            else:
+                pool = _get_all_pool()
+                chunk_results = (future.result() for future in as_completed([pool.submit(fetch_chunk, chunk) for chunk in chunks]))
+            for chunk_result in chunk_results:
+                for doc in chunk_result:
+                    snapshots[doc.id] = doc
+
+            # getAll does not guarantee ordering, so restore the order of doc_ids
+            for doc_id in doc_ids:
+                doc = snapshots.get(doc_id)
+                if doc is not None and doc.exists:
+                    documents.append(from_snapshot(doc))
 
         return documents
 
+    @classmethod
+    async def aget_by_id(
+        cls: Type[T],
+        doc_id: str,
+        namespace: str = "collections",
+        read_write_to_cache: Optional[bool] = None,
+    ) -> Optional[T]:
+        """Async get_by_id, so callers can overlap many reads with asyncio.gather."""
+        if read_write_to_cache is None:
+            read_write_to_cache = get_config().get("read_write_to_cache", False)
+
+        if read_write_to_cache:
+            return cls.get_by_id(doc_id, namespace, read_write_to_cache=True)
+
+        doc = await async_db.collection(cls._get_collection_name()).document(doc_id).get()
+        return cls._from_snapshot(doc) if doc.exists else None
+
+    @classmethod
+    async def aget_by_ids(
+        cls: Type[T],
+        doc_ids: List[str],
+        namespace: str = "collections",
+        read_write_to_cache: Optional[bool] = None,
+    ) -> List[T]:
+        """Async get_by_ids.
+
+        Prefer this over gathering aget_by_id calls: each chunk of ids is a
+        single BatchGetDocuments request, like getAll, rather than one request
+        per document.
+        """
+        if read_write_to_cache is None:
+            read_write_to_cache = get_config().get("read_write_to_cache", False)
+
+        if read_write_to_cache:
+            return cls.get_by_ids(doc_ids, namespace, read_write_to_cache=True)
+
+        collection_ref = async_db.collection(cls._get_collection_name())
+
+        async def fetch_chunk(chunk):
+            return [doc async for doc in async_db.get_all([collection_ref.document(doc_id) for doc_id in chunk])]
+
+        chunk_results = await asyncio.gather(*[fetch_chunk(chunk) for chunk in _chunks(doc_ids, GET_ALL_CHUNK_SIZE)])
+        snapshots = {doc.id: doc for chunk in chunk_results for doc in chunk}
+
+        # getAll does not guarantee ordering, so restore the order of doc_ids
+        documents = []
+        for doc_id in doc_ids:
+            doc = snapshots.get(doc_id)
+            if doc is not None and doc.exists:
+                documents.append(cls._from_snapshot(doc))
+        return documents
+
     @classmethod
     def get_page(
         cls: Type[T],
-        page: int = 1,
+        *,
+        cursor: Optional[Any] = None,
         page_size: int = 10,
         query_params: Optional[Dict[str, Any]] = None,
         array_contains: Optional[Dict[str, Any]] = None,
-        sort_by: Optional[str] = None,  # New parameter for sorting field
-        sort_direction: Optional[str] = "asc",  # New parameter for sort direction
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = "asc",
         namespace: str = "collections",
         read_write_to_cache: Optional[bool] = None,
-    ) -> List[T]:
+    ) -> Tuple[List[T], Optional[Any]]:
+        """Fetch one page of documents ordered by ``sort_by``, then by id.
+
+        Pages are addressed by cursor rather than offset, so every page costs
+        ``page_size`` reads regardless of depth. Without ``sort_by`` documents
+        are ordered by id alone, which needs no composite index. Pass the
+        returned ``next_cursor`` back in to fetch the following page: the last
+        document's ``(sort value, id)`` pair, or just its id without
+        ``sort_by``. It is ``None`` once a page comes back shorter than
+        ``page_size``.
+        """
         collection_name = cls._get_collection_name()
-        start = (page - 1) * page_size
-        end = start + page_size
 
         if read_write_to_cache is None:
             read_write_to_cache = get_config().get("read_write_to_cache", False)
 
+        cache_key = None
         if read_write_to_cache:
             # Handle the test mode logic with query_params and array_contains filtering
-            all_docs = cache_handler.query_collection(
-                collection_name, query_params, namespace
+            page_docs = cache_handler.query_collection(
+                collection_name,
+                query_params,
+                namespace,
+                array_contains=array_contains,
+                order_by=sort_by or DOCUMENT_ID,
+                descending=sort_direction != "asc",
+                start_after=cursor,
+                limit=page_size,
             )
-            if array_contains:
-                all_docs = [
-                    doc
-                    for doc in all_docs
-                    if all(
-                        doc.get(key) and value in doc.get(key)
-                        for key, value in array_contains.items()
-                    )
-                ]
-            return [
-                cls(**doc) for doc in all_docs[start:end]
-            ]  # Paginate after filtering
+            results = [cls._from_cache(**doc) for doc in page_docs]
+            last_sort_value = get_field(page_docs[-1], sort_by) if sort_by and page_docs else None
         else:
-            # The existing non-test mode logic to query Firebase
-            query = db.collection(collection_name)
+            if cls.__cache_ttl__:
+                try:
+                    cache_key = (
+                        collection_name,
+                        _collection_generations.get(collection_name, 0),
+                        frozenset((query_params or {}).items()),
+                        frozenset((array_contains or {}).items()),
+                        cursor,
+                        page_size,
+                        sort_by,
+                        sort_direction,
+                    )
+                    hash(cache_key)
+                except TypeError:
+                    # Unhashable filter values (e.g. "in" lists) or cursors aren't cached
+                    cache_key = None
+                hit = _read_cache.get(cache_key) if cache_key is not None else None
+                # Keyed by collection rather than class so the cache doesn't keep model
+                # classes alive; another model on the same collection doesn't count as a hit
+                if hit is not None and all(type(result) is cls for result in hit[0]):
+                    results, next_cursor = hit
+                    return [result.copy(deep=True) for result in results], next_cursor
+
+            query = cls._collection_ref()
             if query_params:
                 for key, value in query_params.items():
                     if isinstance(value, list):
@@ -146,23 +462,39 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
                 for key, value in array_contains.items():
                     query = query.where(key, "array_contains", value)
 
-            # Apply sorting
+            # Apply sorting, with the document id breaking ties so rows sharing a
+            # sort value aren't skipped
+            direction = firestore.Query.ASCENDING if sort_direction == "asc" else firestore.Query.DESCENDING
+            document_id = FieldPath.document_id()
             if sort_by:
-                direction = firestore.Query.ASCENDING if sort_direction == "asc" else firestore.Query.DESCENDING
                 query = query.order_by(sort_by, direction=direction)
-
-            # Apply pagination
-            docs = query.offset(start).limit(page_size).stream()
-            return [
-            cls(
-                id=doc.id,
-                **(lambda d: {k: v for k, v in d.items() if k != "id"})(
-                    doc.to_dict()
-                ),
-            )
-            for doc in docs
-        ]
-
+            query = query.order_by(document_id, direction=direction)
+            if cursor is not None:
+                if sort_by:
+                    cursor_value, cursor_id = cursor
+                    query = query.start_after({sort_by: cursor_value, document_id: cursor_id})
+                else:
+                    query = query.start_after({document_id: cursor})
+
+            docs = list(query.limit(page_size).stream())
+            from_snapshot = cls._from_snapshot
+            results = [from_snapshot(doc) for doc in docs]
+            last_sort_value = None
+            if sort_by and docs:
+                try:
+                    last_sort_value = docs[-1].get(sort_by)
+                except KeyError:
+                    pass
+
+        # A short page is the last one; the cursor itself may hold a None sort value.
+        # The sort value comes from the stored document, so dotted paths resolve and
+        # it is in the form the query compares against rather than the validated one.
+        next_cursor = None
+        if len(results) == page_size:
+            next_cursor = (last_sort_value, results[-1].id) if sort_by else results[-1].id
+        if cache_key is not None:
+            _read_cache.set(cache_key, ([result.copy(deep=True) for result in results], next_cursor), cls.__cache_ttl__)
+        return results, next_cursor
 
     @classmethod
     def get_all(cls: Type[T], read_write_to_cache: Optional[bool] = None, namespace: str = "collections") -> List[T]:
@@ -172,19 +504,11 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
 
         if read_write_to_cache:
             all_docs = cache_handler.list_collection(collection_name, namespace)
-            return [cls(**doc) for doc in all_docs]
+            return [cls._from_cache(**doc) for doc in all_docs]
         else:
-            docs = db.collection(collection_name).stream()
-
-            return [
-                cls(
-                    id=doc.id,
-                    **(lambda d: {k: v for k, v in d.items() if k != "id"})(
-                        doc.to_dict()
-                    ),
-                )
-                for doc in docs
-            ]
+            docs = cls._collection_ref().stream()
+
+            return [cls._from_snapshot(doc) for doc in docs]
 
     def save(
         self, generate_new_id: bool = False, read_write_to_cache: Optional[bool] = None, namespace: str = "collections"
@@ -200,36 +524,124 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
             # Check if the document is already in the cache
             existing_document = cache_handler.get_document(collection_name, self.id, namespace)
             if existing_document:
-                # Update the existing document in the cache
-                cache_handler.update_document(collection_name, self.id, self.dict(), namespace)
+                # Update the existing document in the cache with the fields that changed
+                cache_handler.update_document(collection_name, self.id, self.dict(include=self._changed_fields()), namespace)
             else:
                 # Add new document to the cache
                 cache_handler.add_document(collection_name, self.id, self.dict(), namespace)
         else:
-            collection_name = (
-                self.__fields__["collection_name"].default
-                if "collection_name" in self.__fields__
-                and self.__fields__["collection_name"].default
-                else p.plural(self.__class__.__name__)
-            )
-
-            # If the ID doesn't exist, doesn't match the Firebase pattern, or if we want to generate a new one
+            # If the ID doesn't exist or if we want to generate a new one
             if not self.id or generate_new_id:
-                data_to_save = self.dict(exclude={"id", "created_at", "updated_at"})
-                data_to_save["created_at"] = firestore.SERVER_TIMESTAMP
-                data_to_save["updated_at"] = firestore.SERVER_TIMESTAMP
+                data_to_save = self._firestore_payload(is_new=True)
 
                 # Add a new document to the Firestore collection
-                _, new_doc_ref = db.collection(collection_name).add(data_to_save)
+                new_doc_ref = self._collection_ref().document()
+                new_doc_ref.set(data_to_save, retry=WRITE_RETRY)
                 # Set the ID from the new document reference
                 self.id = new_doc_ref.id
             else:
-                data_to_save = self.dict()
-                data_to_save["updated_at"] = firestore.SERVER_TIMESTAMP
+                data_to_save = self._firestore_payload(is_new=False)
 
                 # Get the document reference and update it with the new data
-                doc_ref = db.collection(collection_name).document(self.id)
-                doc_ref.set(data_to_save, merge=True)
+                doc_ref = self._collection_ref().document(self.id)
+                doc_ref.set(data_to_save, merge=True, retry=WRITE_RETRY)
+            _invalidate_reads(collection_name, [self.id])
+
+        self._mark_clean()
+
+    def _firestore_payload(self, is_new: bool) -> Dict[str, Any]:
+        if is_new:
+            data_to_save = self.dict(exclude={"id", "created_at", "updated_at"})
+            data_to_save["created_at"] = firestore.SERVER_TIMESTAMP
+        else:
+            # Existing documents only need the fields that changed; set(merge=True) keeps the rest
+            data_to_save = self.dict(include=self._changed_fields())
+        data_to_save["updated_at"] = firestore.SERVER_TIMESTAMP
+        return data_to_save
+
+    @classmethod
+    def bulk_save(
+        cls: Type[T],
+        instances: List[T],
+        generate_new_ids: bool = False,
+        read_write_to_cache: Optional[bool] = None,
+        namespace: str = "collections",
+    ) -> None:
+        """Save many instances at once.
+
+        Writes go through Firestore's BulkWriter, which commits them in
+        parallel and retries failed writes itself. Writes that still fail are
+        raised as a GoogleAPICallError once the rest have finished. Clients
+        without ``bulk_writer`` fall back to concurrent WriteBatch commits of up to
+        WRITE_BATCH_SIZE documents each, retried per batch with WRITE_RETRY.
+        """
+        if read_write_to_cache is None:
+            read_write_to_cache = get_config().get("read_write_to_cache", False)
+
+        if read_write_to_cache:
+            for instance in instances:
+                instance.save(generate_new_id=generate_new_ids, read_write_to_cache=True, namespace=namespace)
+            return
+
+        collection_ref = cls._collection_ref()
+        writes = []
+        for instance in instances:
+            is_new = not instance.id or generate_new_ids
+            data_to_save = instance._firestore_payload(is_new=is_new)
+            # document() without an id allocates one client side, like add() does
+            doc_ref = collection_ref.document() if is_new else collection_ref.document(instance.id)
+            writes.append((instance, doc_ref, data_to_save, is_new))
+
+        try:
+            if hasattr(db, "bulk_writer"):
+                # Only hand out new ids and mark instances clean once their write has gone through
+                instances_by_path = {doc_ref.path: (instance, is_new) for instance, doc_ref, _, is_new in writes}
+
+                def on_write_result(doc_ref, _result, _bulk_writer):
+                    instance, is_new = instances_by_path[doc_ref.path]
+                    if is_new:
+                        instance.id = doc_ref.id
+                    instance._mark_clean()
+
+                # BulkWriter drops a write once it gives up retrying and close() doesn't
+                # raise, so collect the final failures and raise them ourselves
+                failures = []
+
+                def on_write_error(failure, _bulk_writer):
+                    if failure.attempts < BULK_WRITE_MAX_ATTEMPTS:
+                        return True
+                    failures.append(failure)
+                    return False
+
+                bulk_writer = db.bulk_writer()
+                bulk_writer.on_write_result(on_write_result)
+                bulk_writer.on_write_error(on_write_error)
+                for _, doc_ref, data_to_save, is_new in writes:
+                    bulk_writer.set(doc_ref, data_to_save, merge=not is_new)
+                bulk_writer.close()
+                if failures:
+                    raise exceptions.from_grpc_status(
+                        failures[0].code,
+                        f"bulk_save failed to write {len(failures)} of {len(writes)} documents: {failures[0].message}",
+                    )
+            else:
+                def commit_chunk(chunk):
+                    batch = db.batch()
+                    for _, doc_ref, data_to_save, is_new in chunk:
+                        batch.set(doc_ref, data_to_save, merge=not is_new)
+                    batch.commit(retry=WRITE_RETRY)
+                    for instance, doc_ref, _, is_new in chunk:
+                        if is_new:
+                            instance.id = doc_ref.id
+                        instance._mark_clean()
+
+                with ThreadPoolExecutor(max_workers=WRITE_BATCH_MAX_WORKERS) as executor:
+                    futures = [executor.submit(commit_chunk, chunk) for chunk in _chunks(writes, WRITE_BATCH_SIZE)]
+                    for future in futures:
+                        future.result()
+        finally:
+            # Some writes may have landed even if others failed
+            _invalidate_reads(cls._get_collection_name(), [doc_ref.id for _, doc_ref, _, _ in writes])
 
     def delete(self, read_write_to_cache: Optional[bool] = None, namespace: str = "collections" ) -> None:
         collection_name = self._get_collection_name()
@@ -239,8 +651,9 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
         if read_write_to_cache:
             cache_handler.delete_document(collection_name, self.id, namespace)
         else:
-            doc_ref = db.collection(collection_name).document(self.id)
-            doc_ref.delete()
+            doc_ref = self._collection_ref().document(self.id)
+            doc_ref.delete(retry=WRITE_RETRY)
+            _invalidate_reads(collection_name, [self.id])
 
     def merge(
         self,
@@ -253,36 +666,45 @@ class BaseFirebaseModel(BaseModel, Generic[T]):
         if read_write_to_cache is None:
             read_write_to_cache = get_config().get("read_write_to_cache", False)
 
+        if isinstance(update_data, BaseFirebaseModel):
+            update_data = update_data.dict()
+
+        # Default properties that shouldn't be overwritten, combined with user provided excludes
+        default_exclude = {"id", "created_at"} if not overwrite_id else {"created_at"}
+        excluded = default_exclude.union(exclude_props)
+
         # Update the instance properties
+        changed = set()
         for key, value in update_data.items():
-            if key not in exclude_props:
+            if key not in excluded:
                 setattr(self, key, value)
+                changed.add(key)
+
+        if not changed or not self.id:
+            return
 
-        # Log the merge or update to the cache if in test mode
+        # Only write the merged fields, not the whole document. Like set(merge=True),
+        # this creates the document if it hasn't been saved yet.
+        payload = self.dict(include=changed)
+        collection_name = self._get_collection_name()
         if read_write_to_cache:
-            collection_name = self._get_collection_name()
-            cache_handler.update_document(collection_name, self.id, self.dict(), namespace)
+            if cache_handler.get_document(collection_name, self.id, namespace) is not None:
+                cache_handler.update_document(collection_name, self.id, payload, namespace)
+            else:
+                # Cached documents carry their id, as save() stores them
+                cache_handler.add_document(collection_name, self.id, {"id": self.id, **payload}, namespace)
         else:
-            # Default properties that shouldn't be overwritten
-            default_exclude = (
-                ["id", "created_at"] if not overwrite_id else ["created_at"]
-            )
-
-            # Combine default excludes with user provided excludes
-            exclude_props.extend(default_exclude)
-
-            if isinstance(update_data, BaseFirebaseModel):
-                update_data = update_data.dict()
+            payload["updated_at"] = firestore.SERVER_TIMESTAMP
+            self._collection_ref().document(self.id).set(payload, merge=True, retry=WRITE_RETRY)
+            _invalidate_reads(collection_name, [self.id])
 
-            # Update the instance properties
-            for key, value in update_data.items():
-                if key not in exclude_props:
-                    setattr(self, key, value)
+        # The merged fields are written, so the next save() doesn't need to send them again
+        if self._dirty_fields is not None:
+            self._dirty_fields -= changed
 
     @staticmethod
     def generate_fake_firebase_id() -> str:
         """Generate a random ID similar to Firestore's document IDs."""
         id_length = 20  # Typical Firestore ID length
-        return "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=id_length)
-        )
+        # Base32 of 15 random bytes is 24 chars from [a-z2-7]; one urandom call instead of a per-char loop
+        return base64.b32encode(os.urandom(15)).decode("ascii").lower()[:id_length]
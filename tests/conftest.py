@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The package lives under src/ and isn't necessarily installed
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
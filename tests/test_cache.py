@@ -0,0 +1,133 @@
+import itertools
+import random
+import time
+
+import pytest
+
+from nosql_yorm.cache import DOCUMENT_ID, NameSpacedCache, _ExpiringLRU
+
+NAMESPACE = "ns"
+COLLECTION = "things"
+FIELD_VALUES = [None, 0, 1, "a", "b", True, [1, 2], [2], (1, 2), ("a",), []]
+QUERY_VALUES = FIELD_VALUES + [2, "missing"]
+ELEMENTS = [1, 2, "a", "missing"]
+
+
+def scan(cache, equalities=None, array_contains=None):
+    """Reference answer: filter the stored documents one by one."""
+    documents = cache.namespaces.get(NAMESPACE, {}).get(COLLECTION, {}).values()
+    return [
+        doc
+        for doc in documents
+        if all(doc.get(key) == value for key, value in (equalities or {}).items())
+        and all(
+            isinstance(doc.get(key), (list, tuple, set)) and value in doc.get(key)
+            for key, value in (array_contains or {}).items()
+        )
+    ]
+
+
+def assert_matches_scan(cache):
+    queries = [({"a": value}, None) for value in QUERY_VALUES]
+    queries += [(None, {"a": element}) for element in ELEMENTS]
+    queries += [({"a": a, "b": b}, None) for a, b in itertools.product(QUERY_VALUES[:6], QUERY_VALUES[:6])]
+    queries += [({"b": value}, {"a": element}) for value in QUERY_VALUES[:6] for element in ELEMENTS]
+    for equalities, array_contains in queries:
+        expected = scan(cache, equalities, array_contains)
+        assert cache.query_collection_indexed(COLLECTION, equalities, array_contains, NAMESPACE) == expected
+        assert cache.query_collection(COLLECTION, equalities, NAMESPACE, array_contains=array_contains) == expected
+
+
+def random_document(rng):
+    return {field: rng.choice(FIELD_VALUES) for field in ("a", "b") if rng.random() < 0.9}
+
+
+def test_indexes_match_a_linear_scan_through_writes():
+    rng = random.Random(0)
+    cache = NameSpacedCache()
+    ids = [f"doc{i}" for i in range(12)]
+    for _ in range(300):
+        document_id = rng.choice(ids)
+        operation = rng.choice(["add", "update", "delete", "direct"])
+        if operation == "add":
+            cache.add_document(COLLECTION, document_id, random_document(rng), NAMESPACE)
+        elif operation == "update":
+            cache.update_document(COLLECTION, document_id, random_document(rng), NAMESPACE)
+        elif operation == "delete":
+            cache.delete_document(COLLECTION, document_id, NAMESPACE)
+        else:
+            cache.namespaces.setdefault(NAMESPACE, {}).setdefault(COLLECTION, {})[document_id] = random_document(rng)
+            cache.reindex()
+        assert_matches_scan(cache)
+
+
+def test_documents_are_copied_in_and_out():
+    cache = NameSpacedCache()
+    data = {"a": "x", "tags": ["t"]}
+    cache.add_document(COLLECTION, "1", data, NAMESPACE)
+    data["a"] = "changed"
+    cache.get_document(COLLECTION, "1", NAMESPACE)["tags"].append("u")
+    cache.query_collection(COLLECTION, {"a": "x"}, NAMESPACE)[0]["a"] = "changed"
+
+    assert cache.get_document(COLLECTION, "1", NAMESPACE) == {"a": "x", "tags": ["t"]}
+    assert cache.query_collection(COLLECTION, {"a": "x"}, NAMESPACE) == [{"a": "x", "tags": ["t"]}]
+    assert cache.query_collection(COLLECTION, {"a": "changed"}, NAMESPACE) == []
+    assert cache.query_collection(COLLECTION, None, NAMESPACE, array_contains={"tags": "u"}) == []
+
+
+def page_through(cache, page_size, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = cache.query_collection(COLLECTION, None, NAMESPACE, start_after=cursor, limit=page_size, **kwargs)
+        pages.extend(page)
+        if len(page) < page_size:
+            return pages
+        last = page[-1]
+        order_by = kwargs["order_by"]
+        cursor = last["id"] if order_by == DOCUMENT_ID else (last.get(order_by), last["id"])
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("order_by", ["rank", DOCUMENT_ID])
+def test_cursor_paging_returns_every_document_once(order_by, descending):
+    cache = NameSpacedCache()
+    for i in range(25):
+        # Few distinct ranks, and some documents without one, so pages split runs of equal values
+        document = {"id": f"doc{i:02d}", "rank": i % 3} if i % 5 else {"id": f"doc{i:02d}"}
+        cache.add_document(COLLECTION, document["id"], document, NAMESPACE)
+
+    pages = page_through(cache, 4, order_by=order_by, descending=descending)
+
+    ids = [doc["id"] for doc in pages]
+    assert sorted(ids) == sorted(f"doc{i:02d}" for i in range(25))
+    if order_by == DOCUMENT_ID:
+        expected = sorted(ids, reverse=descending)
+    else:
+        expected = [doc["id"] for doc in sorted(
+            pages, key=lambda doc: (doc.get("rank") is not None, doc.get("rank") or 0, doc["id"]), reverse=descending
+        )]
+    assert ids == expected
+
+
+def test_query_collection_sorts_on_dotted_paths():
+    cache = NameSpacedCache()
+    for i, city in enumerate(["c", "a", "b"]):
+        cache.add_document(COLLECTION, str(i), {"id": str(i), "address": {"city": city}}, NAMESPACE)
+
+    docs = cache.query_collection(COLLECTION, None, NAMESPACE, order_by="address.city")
+
+    assert [doc["address"]["city"] for doc in docs] == ["a", "b", "c"]
+
+
+def test_expiring_lru_expires_and_evicts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = _ExpiringLRU(maxsize=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    now[0] += 10
+    assert cache.get("a") is None
+    assert cache.get("c") is None
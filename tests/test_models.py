@@ -0,0 +1,189 @@
+import pytest
+
+from nosql_yorm import models
+from nosql_yorm.cache import cache_handler
+from nosql_yorm.models import BaseFirebaseModel
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return None if self._data is None else dict(self._data)
+
+    def get(self, field_path):
+        return self._data[field_path]
+
+
+class FakeDocument:
+    def __init__(self, client, collection, doc_id):
+        self.client, self.collection, self.id = client, collection, doc_id
+
+    def get(self):
+        self.client.reads += 1
+        return FakeSnapshot(self.id, self.client.store.get(self.collection, {}).get(self.id))
+
+    def set(self, data, merge=False, retry=None):
+        documents = self.client.store.setdefault(self.collection, {})
+        if merge and self.id in documents:
+            documents[self.id].update(data)
+        else:
+            documents[self.id] = dict(data)
+
+    def delete(self, retry=None):
+        self.client.store.get(self.collection, {}).pop(self.id, None)
+
+
+class FakeQuery:
+    """Enough of a Firestore query for get_page: == filters, order_by, start_after and limit."""
+
+    def __init__(self, client, collection, operations=()):
+        self.client, self.collection, self.operations = client, collection, operations
+
+    def _then(self, *operation):
+        return FakeQuery(self.client, self.collection, self.operations + (operation,))
+
+    def where(self, field, op, value):
+        return self._then("where", field, value)
+
+    def order_by(self, field, direction="ASCENDING"):
+        return self._then("order_by", field, direction)
+
+    def start_after(self, values):
+        return self._then("start_after", values)
+
+    def limit(self, count):
+        return self._then("limit", count)
+
+    def stream(self):
+        self.client.reads += 1
+        items = list(self.client.store.get(self.collection, {}).items())
+        orders = []
+
+        def key(item):
+            return tuple(item[0] if field == "__name__" else item[1][field] for field, _ in orders)
+
+        for operation, *args in self.operations:
+            if operation == "where":
+                items = [item for item in items if item[1].get(args[0]) == args[1]]
+            elif operation == "order_by":
+                orders.append(tuple(args))
+                items.sort(key=key, reverse=args[1] == "DESCENDING")
+            elif operation == "start_after":
+                cursor = tuple(args[0][field] for field, _ in orders)
+                descending = orders[0][1] == "DESCENDING"
+                items = [item for item in items if (key(item) < cursor if descending else key(item) > cursor)]
+            elif operation == "limit":
+                items = items[: args[0]]
+        return iter([FakeSnapshot(doc_id, dict(data)) for doc_id, data in items])
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, client, collection):
+        super().__init__(client, collection)
+
+    def document(self, doc_id=None):
+        return FakeDocument(self.client, self.collection, doc_id or models.BaseFirebaseModel.generate_fake_firebase_id())
+
+
+class FakeFirestore:
+    def __init__(self):
+        self.store = {}
+        self.reads = 0
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+
+class Item(BaseFirebaseModel):
+    __collection_name__ = "items"
+    rank: int = 0
+
+
+class CachedItem(BaseFirebaseModel):
+    __collection_name__ = "cached_items"
+    __cache_ttl__ = 60
+    rank: int = 0
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    client = FakeFirestore()
+    monkeypatch.setattr(models, "db", client)
+    models._read_cache.clear()
+    yield client
+    models._read_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache_handler.clear_all_data()
+    yield
+    cache_handler.clear_all_data()
+
+
+def page_through(read_write_to_cache, **kwargs):
+    results, cursor = [], None
+    while True:
+        page, cursor = Item.get_page(cursor=cursor, page_size=4, read_write_to_cache=read_write_to_cache, **kwargs)
+        results.extend(page)
+        if cursor is None:
+            return results
+
+
+@pytest.mark.parametrize("sort_direction", ["asc", "desc"])
+@pytest.mark.parametrize("sort_by", ["rank", None])
+def test_get_page_pages_across_equal_sort_values(firestore, sort_by, sort_direction):
+    for i in range(25):
+        Item(id=f"item{i:02d}", rank=i % 3).save(read_write_to_cache=True)
+        firestore.store.setdefault("items", {})[f"item{i:02d}"] = {"rank": i % 3}
+
+    for read_write_to_cache in (True, False):
+        results = page_through(read_write_to_cache, sort_by=sort_by, sort_direction=sort_direction)
+
+        ids = [item.id for item in results]
+        expected = sorted(
+            ids, key=lambda doc_id: (int(doc_id[4:]) % 3, doc_id) if sort_by else doc_id, reverse=sort_direction == "desc"
+        )
+        assert ids == expected
+        assert len(set(ids)) == 25
+
+
+def test_get_by_id_cache_is_invalidated_by_save_and_delete(firestore):
+    CachedItem(id="a", rank=1).save(read_write_to_cache=False)
+
+    assert CachedItem.get_by_id("a", read_write_to_cache=False).rank == 1
+    reads = firestore.reads
+    assert CachedItem.get_by_id("a", read_write_to_cache=False).rank == 1
+    assert firestore.reads == reads
+
+    CachedItem(id="a", rank=2).save(read_write_to_cache=False)
+    assert CachedItem.get_by_id("a", read_write_to_cache=False).rank == 2
+
+    CachedItem(id="a").delete(read_write_to_cache=False)
+    assert CachedItem.get_by_id("a", read_write_to_cache=False) is None
+
+
+def test_get_page_cache_is_invalidated_by_save_and_delete(firestore):
+    CachedItem(id="a", rank=1).save(read_write_to_cache=False)
+
+    assert [item.rank for item in CachedItem.get_page(read_write_to_cache=False)[0]] == [1]
+    reads = firestore.reads
+    CachedItem.get_page(read_write_to_cache=False)
+    assert firestore.reads == reads
+
+    CachedItem(id="b", rank=2).save(read_write_to_cache=False)
+    assert [item.rank for item in CachedItem.get_page(read_write_to_cache=False)[0]] == [1, 2]
+
+    CachedItem(id="a").delete(read_write_to_cache=False)
+    assert [item.rank for item in CachedItem.get_page(read_write_to_cache=False)[0]] == [2]
+
+
+def test_cached_reads_are_copies(firestore):
+    CachedItem(id="a", rank=1).save(read_write_to_cache=False)
+    CachedItem.get_by_id("a", read_write_to_cache=False).rank = 5
+
+    assert CachedItem.get_by_id("a", read_write_to_cache=False).rank == 1